@@ -0,0 +1,123 @@
+# Núcleo de la simulación: constantes, trayectoria y figura base
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+
+# Constantes físicas
+q_proton = 1.602e-19
+m_proton = 1.672e-27
+
+# Parámetros iniciales
+B_initial = 0.005
+velocity_initial = 15000
+# La solución es exacta en cada muestra, así que basta un muestreo más grueso
+# (mismo tiempo total de 50 µs que con dt=1e-8 y 5000 pasos de Euler)
+dt = 1e-7
+n_steps = 500
+field_start_pos_x = 0.0
+initial_pos_x = -0.02
+
+# Rangos de los sliders
+B_MIN, B_MAX, B_STEP = 0.005, 0.01, 0.0005
+V_MIN, V_MAX, V_STEP = 5000, 22000, 1000
+
+# Número de trayectorias distintas que se pueden pedir (B, velocidad, B = 0)
+N_TRAYECTORIAS = (round((B_MAX - B_MIN) / B_STEP) + 1) * ((V_MAX - V_MIN) // V_STEP + 1) * 2
+
+# ESCALA FIJA
+X_LIM_LEFT = -0.05
+X_LIM_RIGHT = 0.05
+Y_LIM = 0.1
+
+# Puntos de campo magnético (a la derecha), fijos para toda la app
+DOTS_X, DOTS_Y = np.meshgrid(np.linspace(0.005, X_LIM_RIGHT - 0.005, 6),
+                             np.linspace(-Y_LIM + 0.005, -0.005, 6))
+DOTS_X = DOTS_X.ravel()
+DOTS_Y = DOTS_Y.ravel()
+
+# Función de simulación (solución analítica de la fuerza de Lorentz)
+# La caché tiene espacio para todas las combinaciones de los sliders, así que
+# actúa como una tabla de trayectorias que se llena a medida que se usan
+@st.cache_data(show_spinner=False, max_entries=N_TRAYECTORIAS)
+def run_simulation(b_mag, v_mag, field_off_flag):
+    """Calcula la trayectoria exacta con los parámetros dados"""
+    q = q_proton
+    m = m_proton
+    x_limit = 2 * abs(X_LIM_RIGHT)
+    y_limit = 2 * abs(Y_LIM)
+    
+    # Si el botón de campo nulo está activo (o B=0) la trayectoria es una recta
+    # que abandona la zona de seguridad por la derecha
+    campo_activo = not field_off_flag and b_mag != 0.0
+    
+    if campo_activo:
+        # Instante de entrada al campo (x = field_start_pos_x)
+        t_entry = (field_start_pos_x - initial_pos_x) / v_mag
+        
+        # Frecuencia de ciclotrón y radio de Larmor
+        omega = q * b_mag / m
+        radio = v_mag / omega
+        
+        # Con B || +z el protón gira en sentido horario alrededor de (x0, -r)
+        # y, tras media vuelta, sale del campo en (x0, -2r) moviéndose hacia -x
+        t_exit = t_entry + np.pi / omega
+        t_out = t_exit + (field_start_pos_x + x_limit) / v_mag
+    else:
+        t_out = (x_limit - initial_pos_x) / v_mag
+    
+    # Solo se evalúan los pasos hasta salir de la zona de seguridad
+    k_max = min(n_steps, int(t_out / dt) + 2)
+    times = np.arange(k_max) * dt
+    
+    # Fuera del campo el movimiento es rectilíneo uniforme
+    posiciones_x = initial_pos_x + v_mag * times
+    posiciones_y = np.zeros(k_max)
+    
+    if campo_activo:
+        en_campo = (times >= t_entry) & (times < t_exit)
+        fase = omega * (times[en_campo] - t_entry)
+        posiciones_x[en_campo] = field_start_pos_x + radio * np.sin(fase)
+        posiciones_y[en_campo] = -radio * (1.0 - np.cos(fase))
+        
+        salida = times >= t_exit
+        posiciones_x[salida] = field_start_pos_x - v_mag * (times[salida] - t_exit)
+        posiciones_y[salida] = -2.0 * radio
+    
+    # Corte de seguridad exacto (se conserva el primer punto fuera)
+    fuera = (np.abs(posiciones_x) > x_limit) | (np.abs(posiciones_y) > y_limit)
+    k = int(np.argmax(fuera)) + 1 if fuera.any() else k_max
+    
+    # El cálculo se hace en float64; para guardar y graficar basta float32
+    return (posiciones_x[:k].astype(np.float32),
+            posiciones_y[:k].astype(np.float32),
+            times[:k].astype(np.float32))
+
+# Figura con los elementos estáticos
+def build_figure():
+    """Crea la figura y devuelve los artistas que cambian entre ejecuciones"""
+    fig, ax = plt.subplots(figsize=(9, 7))  # Tamaño balanceado
+    
+    ax.set_aspect('equal', 'box')
+    # ax.set_title('Trayectoria de un protón en un campo magnético uniforme', fontsize=12)
+    ax.set_xlabel('Posición X', fontsize=10)
+    ax.set_ylabel('Posición Y', fontsize=10)
+    ax.grid(True)
+    ax.set_facecolor('#f0f0f0')
+    
+    # ESCALA FIJA
+    ax.set_xlim(X_LIM_LEFT, X_LIM_RIGHT)
+    ax.set_ylim(-Y_LIM, 0.01)
+    
+    # Línea divisoria
+    ax.axvline(x=field_start_pos_x, color='red', linewidth=2, linestyle='--')
+    
+    # Puntos de campo magnético (a la derecha)
+    field_dots = ax.scatter(DOTS_X, DOTS_Y, marker='.', color='black', s=50)
+    
+    # Trayectoria (línea azul), posición inicial y cuadro de información
+    line, = ax.plot([], [], 'b-', lw=2)
+    punto, = ax.plot(initial_pos_x, 0.0, 'ro', markersize=8)
+    info_text = ax.text(0.02, 0.95, '', transform=ax.transAxes, fontsize=9,
+                        bbox=dict(boxstyle="round,pad=0.3", facecolor="white", alpha=0.8))
+    
+    return fig, line, punto, info_text, field_dots